@@ -52,22 +52,22 @@ class Controller:
         self.menu_buttons = []
 
         for i, text in enumerate(self.config.menu_options):
-            button_x = (self.config.display["screen_size"][0] / 2) - (
-                self.config.menu_buttons["width"] / 2
+            button_x = (self.config.display.screen_size[0] / 2) - (
+                self.config.menu_buttons.width / 2
             )
-            button_y = self.config.menu_buttons["menu_first_y"] + (
+            button_y = self.config.menu_buttons.menu_first_y + (
                 i
                 * (
-                    self.config.menu_buttons["height"]
-                    + self.config.menu_buttons["padding"]
+                    self.config.menu_buttons.height
+                    + self.config.menu_buttons.padding
                 )
             )
 
             button_rect = pygame.Rect(
                 button_x,
                 button_y,
-                self.config.menu_buttons["width"],
-                self.config.menu_buttons["height"],
+                self.config.menu_buttons.width,
+                self.config.menu_buttons.height,
             )
 
             self.menu_buttons.append({"text": text, "rect": button_rect})
@@ -194,9 +194,9 @@ class Controller:
             direction_x,
             direction_y,
             item.damage,
-            self.config.combat["bullet_speed"],
+            self.config.combat.bullet_speed,
             item.projectile_range,
-            self.config.combat["projectile_texture"],
+            self.projectile_manager.projectile_texture,
         )
         self.projectile_manager.add_projectile(projectile)
 
@@ -262,12 +262,12 @@ class Controller:
         self.config.state = "PLAYING"
         self.config.current_score = 0
 
-        self.model.hp = self.config.player["hp"]
-        self.model.position_x, self.model.position_y = self.config.player[
-            "spawn_location"
-        ]
+        self.model.hp = self.config.player.hp
+        self.model.position_x, self.model.position_y = (
+            self.config.player.spawn_location
+        )
         self.model.rect.topleft = (self.model.position_x, self.model.position_y)
-        self.model.inventory = model.Inventory()
+        self.model.inventory = model.Inventory(self.config.items.inventory_capacity)
 
         self.enemy_manager.reset_manager()
         self.cars_manager.reset_manager()
@@ -368,7 +368,7 @@ class Controller:
         :return: None
         """
         while self.running:
-            dt = self.clock.tick(self.config.display["fps"]) / 1000.0
+            dt = self.clock.tick(self.config.display.fps) / 1000.0
 
             self._handle_events()
             self._update_logic(dt)
@@ -14,7 +14,7 @@ def main():
 
     config = Config()
 
-    screen = pygame.display.set_mode(config.display["screen_size"])
+    screen = pygame.display.set_mode(config.display.screen_size)
 
     player = Player(config)
 
@@ -1,3 +1,4 @@
+import dataclasses
 import pygame
 import random
 import math
@@ -16,18 +17,18 @@ class Player:
         """
         self.config = config
         player_settings = self.config.player
-        start_x, start_y = player_settings["spawn_location"]
+        start_x, start_y = player_settings.spawn_location
 
         self.rect = pygame.Rect(
-            start_x, start_y, player_settings["hitbox"][0], player_settings["hitbox"][1]
+            start_x, start_y, player_settings.hitbox[0], player_settings.hitbox[1]
         )
         self.position_x = float(start_x)
         self.position_y = float(start_y)
-        self.hp = player_settings["hp"]
-        self.speed = player_settings["speed"]
-        self.sprint_bonus = player_settings["sprint_bonus"]
+        self.hp = player_settings.hp
+        self.speed = player_settings.speed
+        self.sprint_bonus = player_settings.sprint_bonus
 
-        self.inventory = Inventory()
+        self.inventory = Inventory(self.config.items.inventory_capacity)
         self.current_vehicle = None
         self.visible = True
 
@@ -59,15 +60,15 @@ class Player:
         if self.rect.left < 0:
             self.rect.left = 0
             self.position_x = float(self.rect.x)
-        elif self.rect.right > self.config.display["map_size"][0]:
-            self.rect.right = self.config.display["map_size"][0]
+        elif self.rect.right > self.config.display.map_size[0]:
+            self.rect.right = self.config.display.map_size[0]
             self.position_x = float(self.rect.x)
 
         if self.rect.top < 0:
             self.rect.top = 0
             self.position_y = float(self.rect.y)
-        elif self.rect.bottom > self.config.display["map_size"][1]:
-            self.rect.bottom = self.config.display["map_size"][1]
+        elif self.rect.bottom > self.config.display.map_size[1]:
+            self.rect.bottom = self.config.display.map_size[1]
             self.position_y = float(self.rect.y)
 
     def sync_with_vehicle(self):
@@ -90,8 +91,8 @@ class Player:
             item_hitbox = pygame.Rect(
                 item.coordinate_x,
                 item.coordinate_y,
-                self.config.items["item_size"],
-                self.config.items["item_size"],
+                self.config.items.item_size,
+                self.config.items.item_size,
             )
 
             if self.rect.colliderect(item_hitbox) and self.inventory.add_items(item):
@@ -129,14 +130,14 @@ class Enemy(Player):
         :return: None
         """
         super().__init__(config)
-        self.hp = self.config.enemy["hp"]
-        self.damage = self.config.enemy["damage"]
+        self.hp = self.config.enemy.hp
+        self.damage = self.config.enemy.damage
         self.death_time = 0
         self.last_decision_time = 0
         self.last_attack_time = 0
         self.direction: list = [0, 0]
         self.does_sprint = False
-        self.sprint_bonus = self.config.enemy["sprint_bonus"]
+        self.sprint_bonus = self.config.enemy.sprint_bonus
 
         self.position_x = float(start_x)
         self.position_y = float(start_y)
@@ -158,7 +159,7 @@ class Enemy(Player):
         direction_y = self.position_y - player.position_y
         distance = math.sqrt((direction_x**2) + (direction_y**2))
 
-        if distance <= self.config.enemy["distance_to_chase"]:
+        if distance <= self.config.enemy.distance_to_chase:
             distance_x = player.position_x - self.position_x
             distance_y = player.position_y - self.position_y
 
@@ -171,7 +172,7 @@ class Enemy(Player):
             self.does_sprint = False
             if (
                 current_time - self.last_decision_time
-                > self.config.enemy["decision_speed"]
+                > self.config.enemy.decision_speed
             ):
                 angle = random.uniform(0, 2 * math.pi)
                 self.direction[0] = math.cos(angle)
@@ -193,7 +194,7 @@ class Enemy(Player):
 
         if self.rect.colliderect(player.rect):
             current_time = pygame.time.get_ticks()
-            if current_time - self.last_attack_time > self.config.enemy["attack_speed"]:
+            if current_time - self.last_attack_time > self.config.enemy.attack_speed:
                 player.hp -= self.damage
                 print(f"Health: {player.hp}")
                 self.last_attack_time = current_time
@@ -212,25 +213,28 @@ class Enemy_Manager:
         """
         self.enemies_spawned = []
         self.config = config
+        self.weapon_prototypes = [
+            Weapon(self.config, 0, 0, **dataclasses.asdict(weapon))
+            for weapon in self.config.spawnable_weapons
+        ]
 
     def spawn_enemies(self):
         """
         Spawns enemies on the map.
         :return: None
         """
-        while len(self.enemies_spawned) < self.config.enemy["limit"]:
-            spawn_x = random.randint(0, self.config.display["map_size"][0])
-            spawn_y = random.randint(0, self.config.display["map_size"][1])
+        while len(self.enemies_spawned) < self.config.enemy.limit:
+            spawn_x = random.randint(0, self.config.display.map_size[0])
+            spawn_y = random.randint(0, self.config.display.map_size[1])
             enemy = Enemy(self.config, spawn_x, spawn_y)
 
             roll = random.randint(1, 100)
 
-            for weapon in self.config.spawnable_weapons:
-                low, high = weapon["spawn_frequency"]
+            for prototype in self.weapon_prototypes:
+                low, high = prototype.spawn_frequency
 
                 if low <= roll <= high:
-                    new_item = Weapon(self.config, 0, 0, **weapon)
-                    enemy.inventory.slots[0] = new_item
+                    enemy.inventory.slots[0] = prototype.clone(0, 0)
                     break
 
             self.enemies_spawned.append(enemy)
@@ -245,7 +249,7 @@ class Enemy_Manager:
             if (
                 enemy.hp <= 0
                 and pygame.time.get_ticks() - enemy.death_time
-                >= self.config.enemy["fade_time"]
+                >= self.config.enemy.fade_time
             ):
                 self.enemies_spawned.remove(enemy)
                 self.spawn_enemies()
@@ -343,12 +347,12 @@ class Cars:
 
         else:
             if self.current_speed > 0:
-                self.current_speed -= self.config.vehicles["friction"] * dt
+                self.current_speed -= self.config.vehicles.friction * dt
                 if self.current_speed < 0:
                     self.current_speed = 0
 
             elif self.current_speed < 0:
-                self.current_speed += self.config.vehicles["friction"] * dt
+                self.current_speed += self.config.vehicles.friction * dt
                 if self.current_speed > 0:
                     self.current_speed = 0
 
@@ -382,8 +386,8 @@ class Cars:
             self.rect.left = 0
             self.position_x = float(self.rect.x)
             self.current_speed = 0
-        elif self.rect.right > self.config.display["map_size"][0]:
-            self.rect.right = self.config.display["map_size"][0]
+        elif self.rect.right > self.config.display.map_size[0]:
+            self.rect.right = self.config.display.map_size[0]
             self.position_x = float(self.rect.x)
             self.current_speed = 0
 
@@ -391,8 +395,8 @@ class Cars:
             self.rect.top = 0
             self.position_y = float(self.rect.y)
             self.current_speed = 0
-        elif self.rect.bottom > self.config.display["map_size"][1]:
-            self.rect.bottom = self.config.display["map_size"][1]
+        elif self.rect.bottom > self.config.display.map_size[1]:
+            self.rect.bottom = self.config.display.map_size[1]
             self.position_y = float(self.rect.y)
             self.current_speed = 0
 
@@ -431,10 +435,15 @@ class Cars_Manager:
         spawn_offset = 1
         while len(self.cars_on_map) < len(self.config.spawnable_vehicles):
             for vehicle_data in self.config.spawnable_vehicles:
-                position_x = self.config.vehicles["first_spawn_x"] * spawn_offset
-                position_y = self.config.vehicles["first_spawn_y"]
-
-                new_vehicle = Cars(self.config, position_x, position_y, **vehicle_data)
+                position_x = self.config.vehicles.first_spawn_x * spawn_offset
+                position_y = self.config.vehicles.first_spawn_y
+
+                new_vehicle = Cars(
+                    self.config,
+                    position_x,
+                    position_y,
+                    **dataclasses.asdict(vehicle_data),
+                )
                 self.cars_on_map.append(new_vehicle)
                 spawn_offset += 1
 
@@ -487,18 +496,33 @@ class Item:
         self.coordinate_y = coordinate_y
         self.name = name
         self.texture = texture
+        self.texture_surface = None
         self.spawn_frequency = spawn_frequency
         self.use_speed = use_speed
 
         self.hitbox = (
             self.coordinate_x,
             self.coordinate_y,
-            self.config.items["item_size"],
-            self.config.items["item_size"],
+            self.config.items.item_size,
+            self.config.items.item_size,
         )
 
         self.last_use_time = 0
 
+    def clone(self, coordinate_x, coordinate_y):
+        """
+        Creates a copy of the item at the given position without re-running __init__.
+        :param coordinate_x: The X coordinate of the copy.
+        :param coordinate_y: The Y coordinate of the copy.
+        :return: Item
+        """
+        item = self.__class__.__new__(self.__class__)
+        item.__dict__.update(self.__dict__)
+        item.coordinate_x = coordinate_x
+        item.coordinate_y = coordinate_y
+        item.hitbox = (coordinate_x, coordinate_y, self.hitbox[2], self.hitbox[3])
+        return item
+
 
 class Weapon(Item):
     """
@@ -619,23 +643,26 @@ class Item_Manager:
         """
         self.config = config
         self.items_spawned = []
+        self.weapon_prototypes = [
+            Weapon(self.config, 0, 0, **dataclasses.asdict(weapon))
+            for weapon in self.config.spawnable_weapons
+        ]
 
     def spawn_items(self):
         """
         Spawns items on the map.
         :return: None
         """
-        for i in range(self.config.items["item_limit"]):
-            rand_x = random.randint(0, self.config.display["map_size"][0])
-            rand_y = random.randint(0, self.config.display["map_size"][1])
+        for i in range(self.config.items.item_limit):
+            rand_x = random.randint(0, self.config.display.map_size[0])
+            rand_y = random.randint(0, self.config.display.map_size[1])
             roll = random.randint(0, 100)
 
-            for weapon in self.config.spawnable_weapons:
-                low, high = weapon["spawn_frequency"]
+            for prototype in self.weapon_prototypes:
+                low, high = prototype.spawn_frequency
 
                 if low <= roll <= high:
-                    new_item = Weapon(self.config, rand_x, rand_y, **weapon)
-                    self.items_spawned.append(new_item)
+                    self.items_spawned.append(prototype.clone(rand_x, rand_y))
                     break
 
     def reset_manager(self):
@@ -682,7 +709,7 @@ class Projectile:
         :param damage: The damage of the projectile.
         :param speed: The speed of the projectile.
         :param max_distance: The maximum distance the projectile can travel.
-        :param texture: The texture of the projectile.
+        :param texture: The loaded texture surface of the projectile.
         :return: None
         """
         self.config = config
@@ -697,7 +724,7 @@ class Projectile:
 
         self.rect = pygame.Rect(position_x, position_y, 10, 10)
 
-        self.texture = pygame.image.load(texture).convert_alpha()
+        self.texture = texture
 
     def move(self, dt):
         """
@@ -725,6 +752,7 @@ class Projectile_Manager:
     """
     Class responsible for managing projectiles.
     :attrib config: The configuration of the game.
+    :attrib projectile_texture: The texture shared by all projectiles.
     """
     def __init__(self, config):
         """
@@ -734,6 +762,9 @@ class Projectile_Manager:
         """
         self.bullets_on_map = []
         self.config = config
+        self.projectile_texture = pygame.image.load(
+            config.combat.projectile_texture
+        ).convert_alpha()
 
     def add_projectile(self, projectile):
         """
@@ -769,7 +800,7 @@ class Projectile_Manager:
                     enemy.hp -= projectile.damage
 
                     if enemy.hp <= 0:
-                        self.config.current_score += self.config.enemy["points_given"]
+                        self.config.current_score += self.config.enemy.points_given
                         enemy.death_time = pygame.time.get_ticks()
                         enemy.item_dropper(item_manager)
 
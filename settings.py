@@ -1,11 +1,179 @@
+import dataclasses
+from pathlib import Path
+
 import pygame
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class Menu_Buttons_Settings:
+    """
+    Class representing the settings of the menu buttons.
+    """
+
+    width: int
+    height: int
+    padding: int
+    menu_first_y: int
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Display_Settings:
+    """
+    Class representing the settings of the display.
+    """
+
+    screen_size: tuple
+    fps: int
+    map_size: tuple
+    map_texture: str
+    font: str
+    show_hitboxes: bool
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Player_Settings:
+    """
+    Class representing the settings of the player.
+    """
+
+    hitbox: tuple
+    hitbox_color: str
+    texture: str
+    hp: int
+    spawn_location: tuple
+    speed: float
+    sprint_bonus: float
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Enemy_Settings:
+    """
+    Class representing the settings of the enemies.
+    """
+
+    hitbox: tuple
+    hitbox_color: str
+    texture: str
+    hp: int
+    speed: float
+    sprint_bonus: float
+    limit: int
+    damage: int
+    decision_speed: int
+    attack_speed: int
+    distance_to_chase: int
+    fade_time: int
+    points_given: int
+    healthbar_height: int
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Combat_Settings:
+    """
+    Class representing the settings of combat.
+    """
+
+    projectile_texture: str
+    bullet_speed: int
+    grenade_speed: int
+    special_speed: int
+    bullet_limit: int
+    hand_distance: int
+    swing_strength: int
+    recoil_strength: int
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Vehicles_Settings:
+    """
+    Class representing the settings of all vehicles.
+    """
+
+    friction: int
+    amount: int
+    first_spawn_x: int
+    first_spawn_y: int
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Vehicle_Settings:
+    """
+    Class representing the settings of a single vehicle type.
+    """
+
+    hiding: bool
+    hitbox: tuple
+    hitbox_color: str
+    texture: str
+    acceleration: float
+    max_speed: int
+    health: int
+    rotation_speed: float
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Items_Settings:
+    """
+    Class representing the settings of items and the inventory.
+    """
+
+    inventory_capacity: int
+    slot_size: int
+    inventory_gap: int
+    item_size: int
+    item_size_in_hand: int
+    hand_rotation_step: int
+    item_limit: int
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Weapon_Settings:
+    """
+    Class representing the settings of a single weapon type.
+    """
+
+    category: str
+    name: str
+    texture: str
+    spawn_frequency: tuple
+    damage: int
+    projectile_range: int
+    use_speed: int
+    explosion_radius: int
+
+
 class Config:
     """
     Class representing the game configuration.
     """
 
+    __slots__ = (
+        "state",
+        "current_score",
+        "_highscore",
+        "menu_options",
+        "menu_buttons",
+        "display",
+        "player",
+        "enemy",
+        "combat",
+        "inventory_key_map",
+        "vehicles",
+        "bike",
+        "car",
+        "tank",
+        "spawnable_vehicles",
+        "items",
+        "crowbar",
+        "pistol",
+        "rifle",
+        "flamethrower",
+        "grenade",
+        "spawnable_weapons",
+    )
+
+    _cached_highscore = None
+
     def __init__(self):
         """
         Initializes the Config class.
@@ -13,61 +181,62 @@ class Config:
         """
         self.state = "START"
         self.current_score = 0
-        self.highscore = self.load_high_score()
+        self._highscore = None
         self.menu_options = ["START GAME", "OPTIONS", "QUIT GAME"]
 
-        self.menu_buttons = {
-            "width": 300,
-            "height": 150,
-            "padding": 20,
-            "menu_first_y": 250,
-        }
+        self.menu_buttons = Menu_Buttons_Settings(
+            width=300,
+            height=150,
+            padding=20,
+            menu_first_y=250,
+        )
 
-        self.display = {
-            "screen_size": (1200, 800),
-            "fps": 60,
-            "map_size": (6000, 4000),
-            "map_texture": "assets/map_placeholder.png",
-            "font": "assets/Pricedown Bl.otf",
-        }
+        self.display = Display_Settings(
+            screen_size=(1200, 800),
+            fps=60,
+            map_size=(6000, 4000),
+            map_texture="assets/map_placeholder.png",
+            font="assets/Pricedown Bl.otf",
+            show_hitboxes=False,
+        )
 
-        self.player = {
-            "hitbox": (40, 60),
-            "hitbox_color": "black",
-            "texture": "assets/people/player.png",
-            "hp": 100,
-            "spawn_location": (200, 200),
-            "speed": 300.0,
-            "sprint_bonus": 100.0,
-        }
+        self.player = Player_Settings(
+            hitbox=(40, 60),
+            hitbox_color="black",
+            texture="assets/people/player.png",
+            hp=100,
+            spawn_location=(200, 200),
+            speed=300.0,
+            sprint_bonus=100.0,
+        )
 
-        self.enemy = {
-            "hitbox": (40, 60),
-            "hitbox_color": "blue",
-            "texture": "assets/people/enemy.png",
-            "hp": 100,
-            "speed": 150.0,
-            "sprint_bonus": 100.0,
-            "limit": 25,
-            "damage": 10,
-            "decision_speed": 1000,
-            "attack_speed": 1000,
-            "distance_to_chase": 300,
-            "fade_time": 2500,
-            "points_given": 100,
-            "healthbar_height": 5,
-        }
+        self.enemy = Enemy_Settings(
+            hitbox=(40, 60),
+            hitbox_color="blue",
+            texture="assets/people/enemy.png",
+            hp=100,
+            speed=150.0,
+            sprint_bonus=100.0,
+            limit=25,
+            damage=10,
+            decision_speed=1000,
+            attack_speed=1000,
+            distance_to_chase=300,
+            fade_time=2500,
+            points_given=100,
+            healthbar_height=5,
+        )
 
-        self.combat = {
-            "projectile_texture": "assets/weapons/bullet.png",
-            "bullet_speed": 500,
-            "grenade_speed": 300,
-            "special_speed": 50,
-            "bullet_limit": 200,
-            "hand_distance": 30,
-            "swing_strength": 80,
-            "recoil_strength": 15,
-        }
+        self.combat = Combat_Settings(
+            projectile_texture="assets/weapons/bullet.png",
+            bullet_speed=500,
+            grenade_speed=300,
+            special_speed=50,
+            bullet_limit=200,
+            hand_distance=30,
+            swing_strength=80,
+            recoil_strength=15,
+        )
 
         self.inventory_key_map = {
             pygame.K_1: 0,
@@ -81,110 +250,112 @@ class Config:
             pygame.K_9: 8,
         }
 
-        self.vehicles = {
-            "friction": 900,
-            "amount": 3,
-            "first_spawn_x": 100,
-            "first_spawn_y": 100,
-        }
+        self.vehicles = Vehicles_Settings(
+            friction=900,
+            amount=3,
+            first_spawn_x=100,
+            first_spawn_y=100,
+        )
 
-        self.bike = {
-            "hiding": False,
-            "hitbox": (30, 70),
-            "hitbox_color": "red",
-            "texture": "assets/vehicles/bike.png",
-            "acceleration": 900.0,
-            "max_speed": 900,
-            "health": 50,
-            "rotation_speed": 90.0,
-        }
+        self.bike = Vehicle_Settings(
+            hiding=False,
+            hitbox=(30, 70),
+            hitbox_color="red",
+            texture="assets/vehicles/bike.png",
+            acceleration=900.0,
+            max_speed=900,
+            health=50,
+            rotation_speed=90.0,
+        )
 
-        self.car = {
-            "hiding": True,
-            "hitbox": (50, 70),
-            "hitbox_color": "green",
-            "texture": "assets/vehicles/car.png",
-            "acceleration": 450.0,
-            "max_speed": 800,
-            "health": 100,
-            "rotation_speed": 60.0,
-        }
+        self.car = Vehicle_Settings(
+            hiding=True,
+            hitbox=(50, 70),
+            hitbox_color="green",
+            texture="assets/vehicles/car.png",
+            acceleration=450.0,
+            max_speed=800,
+            health=100,
+            rotation_speed=60.0,
+        )
 
-        self.tank = {
-            "hiding": True,
-            "hitbox": (60, 80),
-            "hitbox_color": "dark green",
-            "texture": "assets/vehicles/tank.png",
-            "acceleration": 50.0,
-            "max_speed": 200,
-            "health": 1000,
-            "rotation_speed": 30.0,
-        }
+        self.tank = Vehicle_Settings(
+            hiding=True,
+            hitbox=(60, 80),
+            hitbox_color="dark green",
+            texture="assets/vehicles/tank.png",
+            acceleration=50.0,
+            max_speed=200,
+            health=1000,
+            rotation_speed=30.0,
+        )
 
         self.spawnable_vehicles = [self.bike, self.car, self.tank]
 
-        self.items = {
-            "slot_size": 64,
-            "inventory_gap": 10,
-            "item_size": 64,
-            "item_size_in_hand": 32,
-            "item_limit": 50,
-        }
+        self.items = Items_Settings(
+            inventory_capacity=9,
+            slot_size=64,
+            inventory_gap=10,
+            item_size=64,
+            item_size_in_hand=32,
+            hand_rotation_step=5,
+            item_limit=50,
+        )
 
-        self.crowbar = {
-            "category": "melee",
-            "name": "Crowbar",
-            "texture": "assets/weapons/crowbar.png",
-            "spawn_frequency": (0, 20),
-            "damage": 100,
-            "projectile_range": 50,
-            "use_speed": 500,
-            "explosion_radius": 0,
-        }
+        self.crowbar = Weapon_Settings(
+            category="melee",
+            name="Crowbar",
+            texture="assets/weapons/crowbar.png",
+            spawn_frequency=(0, 20),
+            damage=100,
+            projectile_range=50,
+            use_speed=500,
+            explosion_radius=0,
+        )
 
-        self.pistol = {
-            "category": "pistol",
-            "name": "Pistol",
-            "texture": "assets/weapons/pistol.png",
-            "spawn_frequency": (30, 40),
-            "damage": 25,
-            "projectile_range": 600,
-            "use_speed": 300,
-            "explosion_radius": 0,
-        }
+        self.pistol = Weapon_Settings(
+            category="pistol",
+            name="Pistol",
+            texture="assets/weapons/pistol.png",
+            spawn_frequency=(30, 40),
+            damage=25,
+            projectile_range=600,
+            use_speed=300,
+            explosion_radius=0,
+        )
 
-        self.rifle = {
-            "category": "rifle",
-            "name": "Rifle",
-            "texture": "assets/weapons/rifle.png",
-            "spawn_frequency": (50, 60),
-            "damage": 15,
-            "projectile_range": 800,
-            "use_speed": 100,
-            "explosion_radius": 0,
-        }
+        self.rifle = Weapon_Settings(
+            category="rifle",
+            name="Rifle",
+            texture="assets/weapons/rifle.png",
+            spawn_frequency=(50, 60),
+            damage=15,
+            projectile_range=800,
+            use_speed=100,
+            explosion_radius=0,
+        )
 
-        self.flamethrower = {
-            "category": "special",
-            "name": "Flamethrower",
-            "texture": "assets/weapons/flamethrower.png",
-            "spawn_frequency": (70, 80),
-            "damage": 5,
-            "projectile_range": 500,
-            "use_speed": 50,
-            "explosion_radius": 0,
-        }
+        self.flamethrower = Weapon_Settings(
+            category="special",
+            name="Flamethrower",
+            texture="assets/weapons/flamethrower.png",
+            spawn_frequency=(70, 80),
+            damage=5,
+            projectile_range=500,
+            use_speed=50,
+            explosion_radius=0,
+        )
 
-        self.grenade = {
-            "category": "throwable",
-            "name": "Grenade",
-            "texture": "assets/weapons/grenade.png",
-            "spawn_frequency": (90, 100),
-            "damage": 50,
-            "projectile_range": 1000,
-            "use_speed": 500,
-            "explosion_radius": 100,
-        }
+        self.grenade = Weapon_Settings(
+            category="throwable",
+            name="Grenade",
+            texture="assets/weapons/grenade.png",
+            spawn_frequency=(90, 100),
+            damage=50,
+            projectile_range=1000,
+            use_speed=500,
+            explosion_radius=100,
+        )
 
         self.spawnable_weapons = [
             self.crowbar,
@@ -194,22 +365,45 @@ class Config:
             self.grenade,
         ]
 
-    @staticmethod
-    def load_high_score():
+    @property
+    def highscore(self):
         """
-        Loads the high score from a file.
+        Returns the high score, loading it from the file on first access.
         :return: Int
         """
-        try:
-            with open("highscore.txt", "r") as file:
-                return int(file.read())
-        except (FileNotFoundError, ValueError):
-            return 0
+        if self._highscore is None:
+            self._highscore = self.load_high_score()
+        return self._highscore
+
+    @highscore.setter
+    def highscore(self, value):
+        """
+        Sets the high score.
+        :param value: The new high score.
+        :return: None
+        """
+        self._highscore = value
+
+    @classmethod
+    def load_high_score(cls):
+        """
+        Loads the high score from a file, reading it only once per run.
+        :return: Int
+        """
+        if cls._cached_highscore is None:
+            try:
+                cls._cached_highscore = int(Path("highscore.txt").read_text())
+            except (FileNotFoundError, ValueError):
+                cls._cached_highscore = 0
+        return cls._cached_highscore
 
     def save_high_score(self):
         """
-        Saves the current high score to a file.
+        Saves the current high score to a file if it changed since the last save.
         :return: None
         """
-        with open("highscore.txt", "w") as file:
-            file.write(str(self.highscore))
+        if self.highscore == Config._cached_highscore:
+            return
+
+        Path("highscore.txt").write_text(str(self.highscore))
+        Config._cached_highscore = self.highscore
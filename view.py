@@ -13,6 +13,20 @@ class View:
     :attrib cars_manager: The manager for cars.
     """
 
+    _SELECTED_SLOT_COLOR = Color(0, 0, 255, 128)
+    _UNSELECTED_SLOT_COLOR = Color("dark gray")
+    _BACKGROUND_COLOR = (0, 0, 0)
+    _HEALTH_BAR_BACKGROUND_COLOR = (255, 0, 0)
+    _HEALTH_BAR_FOREGROUND_COLOR = (0, 255, 0)
+    _DEAD_ENEMY_COLOR = (255, 0, 0)
+    _MENU_TEXT_COLOR = (255, 255, 255)
+    _GAME_OVER_COLOR = (255, 0, 0)
+    _HIGHSCORE_COLOR = (255, 255, 0)
+    _INACTIVE_BUTTON_COLOR = (64, 64, 64)
+    _UI_TEXT_COLOR = (0, 0, 255)
+    _TEXT_CACHE_LIMIT = 128
+    _SWUNG_CATEGORIES = frozenset(("melee", "throwable"))
+
     def __init__(self, screen, config, projectile_manager, cars_manager):
         """
         Initializes the View class.
@@ -28,31 +42,78 @@ class View:
         self.cars_manager = cars_manager
         self.textures = {}
         self.hand_textures = {}
-        self.textures[self.config.player["texture"]] = pygame.image.load(
-            self.config.player["texture"]
+        self.rotated_hand_textures = {}
+        self.textures[self.config.player.texture] = pygame.image.load(
+            self.config.player.texture
         ).convert_alpha()
-        self.textures[self.config.enemy["texture"]] = pygame.image.load(
-            self.config.enemy["texture"]
+        self.textures[self.config.enemy.texture] = pygame.image.load(
+            self.config.enemy.texture
         ).convert_alpha()
         for vehicle in self.config.spawnable_vehicles:
-            path = vehicle["texture"]
-            self.textures[path] = pygame.image.load(vehicle["texture"]).convert_alpha()
+            path = vehicle.texture
+            self.textures[path] = pygame.image.load(vehicle.texture).convert_alpha()
 
         for weapon_data in self.config.spawnable_weapons:
-            path = weapon_data["texture"]
+            path = weapon_data.texture
             full_sprite = pygame.image.load(path).convert_alpha()
             self.textures[path] = full_sprite
 
-            size = self.config.items["item_size_in_hand"]
+            size = self.config.items.item_size_in_hand
             self.hand_textures[path] = pygame.transform.scale(full_sprite, (size, size))
 
-        self.map_surface = pygame.Surface(self.config.display["map_size"]).convert()
-        map_texture = pygame.image.load(self.config.display["map_texture"]).convert()
-
-        map_texture_image = pygame.transform.scale(
-            map_texture, self.config.display["map_size"]
+            step = self.config.items.hand_rotation_step
+            for flipped in (False, True):
+                sprite = pygame.transform.flip(self.hand_textures[path], False, flipped)
+                self.rotated_hand_textures[(path, flipped)] = [
+                    pygame.transform.rotate(sprite, angle)
+                    for angle in range(0, 360, step)
+                ]
+
+        self._player_sprite = self.textures[self.config.player.texture]
+        self._enemy_sprite = self.textures[self.config.enemy.texture]
+        self._enemy_hp_inverse = 1.0 / self.config.enemy.hp
+        bar_size = (self.config.enemy.hitbox[0], self.config.enemy.healthbar_height)
+        self._health_bar_background = pygame.Surface(bar_size).convert()
+        self._health_bar_background.fill(self._HEALTH_BAR_BACKGROUND_COLOR)
+        self._health_bar_foreground = pygame.Surface(bar_size).convert()
+        self._health_bar_foreground.fill(self._HEALTH_BAR_FOREGROUND_COLOR)
+        self._projectile_size = self.get_texture(
+            self.config.combat.projectile_texture
+        ).get_size()
+
+        self._screen_width, self._screen_height = self.config.display.screen_size
+        self._max_camera_x = self.config.display.map_size[0] - self._screen_width
+        self._max_camera_y = self.config.display.map_size[1] - self._screen_height
+        self._map_covers_screen = self._max_camera_x >= 0 and self._max_camera_y >= 0
+
+        self._camera_rect = pygame.Rect((0, 0), self.config.display.screen_size)
+        self._player_screen_rect = pygame.Rect((0, 0), self.config.player.hitbox)
+        self._slot_rects = self._build_slot_rects(self.config.items.inventory_capacity)
+        self._inventory_overlay, self._inventory_overlay_position = (
+            self._build_inventory_overlay(self._slot_rects)
+        )
+        self._dead_enemy_surfaces = {}
+        self._fonts = {}
+        self._text_cache = {}
+        self._menu_surface = None
+        self._menu_key = None
+
+        map_texture = pygame.image.load(self.config.display.map_texture).convert()
+        self.map_surface = pygame.transform.scale(
+            map_texture, self.config.display.map_size
         )
-        self.map_surface.blit(map_texture_image, (0, 0))
+
+    def get_texture(self, path):
+        """
+        Returns the loaded texture for the given path, loading it on first use.
+        :param path: The path to the texture.
+        :return: pygame.Surface
+        """
+        texture = self.textures.get(path)
+        if texture is None:
+            texture = pygame.image.load(path).convert_alpha()
+            self.textures[path] = texture
+        return texture
 
     def get_camera_rect(self, player):
         """
@@ -60,37 +121,22 @@ class View:
         :param player: The player object.
         :return: pygame.Rect
         """
-        target_x = player.centerx - (self.config.display["screen_size"][0] / 2)
-        target_y = player.centery - (self.config.display["screen_size"][1] / 2)
+        target_x = player.centerx - (self._screen_width / 2)
+        target_y = player.centery - (self._screen_height / 2)
 
-        limit_x = (
-            self.config.display["map_size"][0] - self.config.display["screen_size"][0]
-        )
-        limit_y = (
-            self.config.display["map_size"][1] - self.config.display["screen_size"][1]
-        )
+        final_x = max(0, min(target_x, self._max_camera_x))
+        final_y = max(0, min(target_y, self._max_camera_y))
 
-        final_x = max(0, min(target_x, limit_x))
-        final_y = max(0, min(target_y, limit_y))
-
-        return pygame.Rect(
-            final_x,
-            final_y,
-            self.config.display["map_size"][0],
-            self.config.display["map_size"][1],
-        )
+        self._camera_rect.topleft = (final_x, final_y)
+        return self._camera_rect
 
-    @staticmethod
-    def world_to_screen(world_position, camera_rect):
+    def _get_view_bounds(self, camera_rect):
         """
-        Converts world coordinates to screen coordinates.
-        :param world_position: The position in world coordinates.
+        Calculates the world coordinates of the visible screen edges.
         :param camera_rect: The camera rectangle.
         :return: tuple
         """
-        screen_x = world_position[0] - camera_rect.x
-        screen_y = world_position[1] - camera_rect.y
-        return screen_x, screen_y
+        return camera_rect.left, camera_rect.top, camera_rect.right, camera_rect.bottom
 
     def _draw_player(self, player_model, camera_rect):
         """
@@ -100,75 +146,111 @@ class View:
         :return: pygame.Rect or None
         """
         if player_model.visible:
-            screen_position = self.world_to_screen(
-                player_model.rect.topleft, camera_rect
+            screen_position = (
+                player_model.rect.x - camera_rect.x,
+                player_model.rect.y - camera_rect.y,
             )
-            player_screen_rect = pygame.Rect(screen_position, player_model.rect.size)
+            player_screen_rect = self._player_screen_rect
+            player_screen_rect.topleft = screen_position
+            player_screen_rect.size = player_model.rect.size
 
-            pygame.draw.rect(
-                self.screen, self.config.player["hitbox_color"], player_screen_rect
-            )
-            sprite = self.textures[self.config.player["texture"]]
-            self.screen.blit(sprite, screen_position)
+            if self.config.display.show_hitboxes:
+                pygame.draw.rect(
+                    self.screen, self.config.player.hitbox_color, player_screen_rect
+                )
+            self.screen.blit(self._player_sprite, screen_position)
             return player_screen_rect
         return None
 
-    def _draw_enemies(self, enemy_manager, camera_rect):
+    def _draw_enemies(self, enemy_manager, camera_rect, current_time):
         """
         Draws the enemies on the screen.
         :param enemy_manager: The enemy manager.
         :param camera_rect: The camera rectangle.
+        :param current_time: The current time in milliseconds.
         :return: None
         """
-        current_time = pygame.time.get_ticks()
+        camera_x, camera_y = camera_rect.topleft
+        left, top, right, bottom = self._get_view_bounds(camera_rect)
+        bar_offset = 10
+        show_hitboxes = self.config.display.show_hitboxes
+
+        enemy_sprite = self._enemy_sprite
+        hitbox_color = self.config.enemy.hitbox_color
+        hp_inverse = self._enemy_hp_inverse
+        bar_background = self._health_bar_background
+        bar_foreground = self._health_bar_foreground
+        bar_height = self.config.enemy.healthbar_height
 
+        blit_sequence = []
+        health_bars = []
         for enemy in enemy_manager.enemies_spawned:
-            screen_position = self.world_to_screen(enemy.rect.topleft, camera_rect)
-            enemy_screen_rect = pygame.Rect(screen_position, enemy.rect.size)
+            enemy_rect = enemy.rect
+            if (
+                enemy_rect.right < left
+                or enemy_rect.left > right
+                or enemy_rect.bottom < top
+                or enemy_rect.top - bar_offset > bottom
+            ):
+                continue
+
+            screen_x = enemy_rect.x - camera_x
+            screen_y = enemy_rect.y - camera_y
 
             if enemy.hp <= 0:
-                self._draw_dead_enemy(enemy, enemy_screen_rect, current_time)
+                self._draw_dead_enemy(enemy, (screen_x, screen_y), current_time)
             else:
-                pygame.draw.rect(
-                    self.screen, self.config.enemy["hitbox_color"], enemy_screen_rect
+                if show_hitboxes:
+                    pygame.draw.rect(
+                        self.screen,
+                        hitbox_color,
+                        (screen_x, screen_y, enemy_rect.width, enemy_rect.height),
+                    )
+                blit_sequence.append((enemy_sprite, (screen_x, screen_y)))
+
+                bar_width = enemy_rect.width
+                bar_position = (screen_x, screen_y - bar_offset)
+                health_ratio = max(0, enemy.hp * hp_inverse)
+                if health_ratio < 1:
+                    health_bars.append(
+                        (
+                            bar_background,
+                            bar_position,
+                            (0, 0, bar_width, bar_height),
+                        )
+                    )
+                health_bars.append(
+                    (
+                        bar_foreground,
+                        bar_position,
+                        (0, 0, bar_width * health_ratio, bar_height),
+                    )
                 )
-                sprite = self.textures[self.config.enemy["texture"]]
-                self.screen.blit(sprite, screen_position)
 
-                bar_width = enemy.rect.width
-                bar_height = self.config.enemy["healthbar_height"]
-                bar_x = enemy_screen_rect.x
-                bar_y = enemy_screen_rect.y - 10
+        blit_sequence.extend(health_bars)
+        self.screen.blits(blit_sequence, doreturn=False)
 
-                pygame.draw.rect(
-                    self.screen, "red", (bar_x, bar_y, bar_width, bar_height)
-                )
-                health_ratio = max(0, enemy.hp / self.config.enemy["hp"])
-                pygame.draw.rect(
-                    self.screen,
-                    "green",
-                    (bar_x, bar_y, bar_width * health_ratio, bar_height),
-                )
-
-    def _draw_dead_enemy(self, enemy, screen_rect, current_time):
+    def _draw_dead_enemy(self, enemy, screen_position, current_time):
         """
         Draws a dead enemy with a fade-out effect.
         :param enemy: The dead enemy object.
-        :param screen_rect: The screen rectangle of the enemy.
+        :param screen_position: The screen position of the enemy.
         :param current_time: The current time in milliseconds.
         :return: None
         """
         time_passed = current_time - enemy.death_time
 
-        fade_ratio = time_passed / self.config.enemy["fade_time"]
+        fade_ratio = time_passed / self.config.enemy.fade_time
         alpha = max(0, 255 - int(fade_ratio * 255))
 
-        # 3. Create the surface and apply transparency
-        enemy_surface = pygame.Surface(enemy.rect.size).convert_alpha()
-        enemy_surface.fill("red")
+        enemy_surface = self._dead_enemy_surfaces.get(enemy.rect.size)
+        if enemy_surface is None:
+            enemy_surface = pygame.Surface(enemy.rect.size).convert()
+            enemy_surface.fill(self._DEAD_ENEMY_COLOR)
+            self._dead_enemy_surfaces[enemy.rect.size] = enemy_surface
         enemy_surface.set_alpha(alpha)
 
-        self.screen.blit(enemy_surface, screen_rect)
+        self.screen.blit(enemy_surface, screen_position)
 
     def _draw_ground_items(self, item_manager, camera_rect):
         """
@@ -177,11 +259,28 @@ class View:
         :param camera_rect: The camera rectangle.
         :return: None
         """
+        camera_x, camera_y = camera_rect.topleft
+        left, top, right, bottom = self._get_view_bounds(camera_rect)
+        item_size = self.config.items.item_size
+        left -= item_size
+        top -= item_size
+
+        blit_sequence = []
         for item in item_manager.items_spawned:
-            item_position = item.coordinate_x, item.coordinate_y
-            screen_position = self.world_to_screen(item_position, camera_rect)
+            item_x = item.coordinate_x
+            item_y = item.coordinate_y
+            if not (left < item_x < right and top < item_y < bottom):
+                continue
 
-            self.screen.blit(self.textures[item.texture], screen_position)
+            screen_position = item_x - camera_x, item_y - camera_y
+
+            texture = item.texture_surface
+            if texture is None:
+                texture = item.texture_surface = self.get_texture(item.texture)
+
+            blit_sequence.append((texture, screen_position))
+
+        self.screen.blits(blit_sequence, doreturn=False)
 
     def _draw_vehicles(self, camera_rect):
         """
@@ -189,14 +288,35 @@ class View:
         :param camera_rect: The camera rectangle.
         :return: None
         """
+        camera_x, camera_y = camera_rect.topleft
+        left, top, right, bottom = self._get_view_bounds(camera_rect)
+        show_hitboxes = self.config.display.show_hitboxes
+        textures = self.textures
+
+        blit_sequence = []
         for vehicle in self.cars_manager.cars_on_map:
-            screen_position = self.world_to_screen(vehicle.rect.topleft, camera_rect)
-            car_screen_rect = pygame.Rect(screen_position, vehicle.rect.size)
+            vehicle_rect = vehicle.rect
+            if (
+                vehicle_rect.right < left
+                or vehicle_rect.left > right
+                or vehicle_rect.bottom < top
+                or vehicle_rect.top > bottom
+            ):
+                continue
+
+            screen_x = vehicle_rect.x - camera_x
+            screen_y = vehicle_rect.y - camera_y
+
+            if show_hitboxes:
+                pygame.draw.rect(
+                    self.screen,
+                    vehicle.hitbox_color,
+                    (screen_x, screen_y, vehicle_rect.width, vehicle_rect.height),
+                )
 
-            pygame.draw.rect(self.screen, vehicle.hitbox_color, car_screen_rect)
+            blit_sequence.append((textures[vehicle.texture], (screen_x, screen_y)))
 
-            sprite = self.textures[vehicle.texture]
-            self.screen.blit(sprite, screen_position)
+        self.screen.blits(blit_sequence, doreturn=False)
 
     def _draw_projectiles(self, camera_rect):
         """
@@ -204,11 +324,28 @@ class View:
         :param camera_rect: The camera rectangle.
         :return: None
         """
+        camera_x, camera_y = camera_rect.topleft
+        left, top, right, bottom = self._get_view_bounds(camera_rect)
+        projectile_width, projectile_height = self._projectile_size
+        left -= projectile_width
+        top -= projectile_height
+
+        blit_sequence = []
         for projectile in self.projectile_manager.bullets_on_map:
-            world_position = projectile.position_x, projectile.position_y
-            screen_position = self.world_to_screen(world_position, camera_rect)
+            if not (
+                left < projectile.position_x < right
+                and top < projectile.position_y < bottom
+            ):
+                continue
+
+            screen_position = (
+                projectile.position_x - camera_x,
+                projectile.position_y - camera_y,
+            )
+
+            blit_sequence.append((projectile.texture, screen_position))
 
-            self.screen.blit(projectile.texture, screen_position)
+        self.screen.blits(blit_sequence, doreturn=False)
 
     def _get_item_offset(self, item, time_passed, dx):
         """
@@ -223,35 +360,35 @@ class View:
 
         progress = time_passed / item.use_speed
         sin_value = math.sin(progress * math.pi)
-        strength = self.config.combat["swing_strength"]
-        recoil = self.config.combat["recoil_strength"]
+        direction = 1 if dx > 0 else -1
 
-        if "melee" in item.category or "throwable" in item.category:
-            return -sin_value * strength if dx > 0 else sin_value * strength
-        elif "special" in item.category:
+        if item.category in self._SWUNG_CATEGORIES:
+            return -direction * sin_value * self.config.combat.swing_strength
+        elif item.category == "special":
             return random.randint(-3, 3) if time_passed < 100 else 0
         else:
-            return sin_value * recoil if dx > 0 else -sin_value * recoil
+            return direction * sin_value * self.config.combat.recoil_strength
 
-    def _draw_rotated_item(self, item, angle, angle_deg, dx, player_rect):
+    def _draw_rotated_item(
+        self, item, cos_angle, sin_angle, angle_deg, dx, player_rect
+    ):
         """
         Draws the rotated item in the player's hand.
         :param item: The item to draw.
-        :param angle: The angle of rotation in radians.
+        :param cos_angle: The cosine of the aiming angle.
+        :param sin_angle: The sine of the aiming angle.
         :param angle_deg: The angle of rotation in degrees.
         :param dx: X distance to the mouse.
         :param player_rect: The screen rectangle of the player.
         :return: None
         """
-        sprite = self.hand_textures[item.texture]
-        if dx < 0:
-            sprite = pygame.transform.flip(sprite, False, True)
+        step = self.config.items.hand_rotation_step
+        rotations = self.rotated_hand_textures[(item.texture, dx < 0)]
+        rotated_sprite = rotations[round(angle_deg / step) % len(rotations)]
 
-        rotated_sprite = pygame.transform.rotate(sprite, angle_deg)
-
-        distance = self.config.combat["hand_distance"]
-        offset_x = math.cos(angle) * distance
-        offset_y = math.sin(angle) * distance
+        distance = self.config.combat.hand_distance
+        offset_x = cos_angle * distance
+        offset_y = sin_angle * distance
 
         target_position = player_rect.centerx + offset_x, player_rect.centery + offset_y
 
@@ -263,77 +400,125 @@ class View:
 
         self.screen.blit(rotated_sprite, rect)
 
-    def _draw_held_item(self, player_model, player_screen_rect):
+    def _draw_held_item(
+        self, player_model, player_screen_rect, current_time, mouse_position
+    ):
         """
         Draws the item currently held by the player.
         :param player_model: The player model.
-        :param player_screen_rect: The screen rectangle of the player.
+        :param player_screen_rect: The screen rectangle of the player, or None
+            if the player is not drawn.
+        :param current_time: The current time in milliseconds.
+        :param mouse_position: The mouse position on the screen.
         :return: None
         """
-        if player_screen_rect is not None:
-            active_item = player_model.inventory.slots[
-                player_model.inventory.selected_index
-            ]
-            if active_item is not None:
-                mouse_x, mouse_y = pygame.mouse.get_pos()
-                px, py = player_screen_rect.center
-                dx, dy = mouse_x - px, mouse_y - py
+        if player_screen_rect is None:
+            return
 
-                angle = math.atan2(dy, dx)
-                angle_deg = -math.degrees(angle)
+        inventory = player_model.inventory
+        active_item = inventory.slots[inventory.selected_index]
+        if active_item is None:
+            return
 
-                time_passed = pygame.time.get_ticks() - active_item.last_use_time
-                angle_deg += self._get_item_offset(active_item, time_passed, dx)
+        mouse_x, mouse_y = mouse_position
+        px, py = player_screen_rect.center
+        dx, dy = mouse_x - px, mouse_y - py
 
-                self._draw_rotated_item(
-                    active_item, angle, angle_deg, dx, player_screen_rect
-                )
+        aim_distance = math.hypot(dx, dy)
+        if aim_distance > 0:
+            cos_angle, sin_angle = dx / aim_distance, dy / aim_distance
+        else:
+            cos_angle, sin_angle = 1.0, 0.0
+        angle_deg = -math.degrees(math.atan2(dy, dx))
 
-    def draw_inventory(self, player_model):
+        time_passed = current_time - active_item.last_use_time
+        angle_deg += self._get_item_offset(active_item, time_passed, dx)
+
+        self._draw_rotated_item(
+            active_item, cos_angle, sin_angle, angle_deg, dx, player_screen_rect
+        )
+
+    def _build_slot_rects(self, capacity):
         """
-        Draws the player's inventory on the screen.
-        :param player_model: The player model.
-        :return: None
+        Calculates the screen rectangles of the inventory slots.
+        :param capacity: The number of inventory slots.
+        :return: list
         """
-        inventory = player_model.inventory
         start_x = 5
         start_y = 5
         columns = 3
 
-        for i in range(inventory.capacity):
+        slot_rects = []
+        for i in range(capacity):
             row = i // columns
             column = i % columns
             slot_x = start_x + (
-                column * self.config.items["slot_size"]
-                + (column * self.config.items["inventory_gap"])
+                column * self.config.items.slot_size
+                + (column * self.config.items.inventory_gap)
                 - 1
             )
             slot_y = start_y + (
-                row * self.config.items["slot_size"]
-                + (row * self.config.items["inventory_gap"])
+                row * self.config.items.slot_size
+                + (row * self.config.items.inventory_gap)
                 - 1
             )
-            slot_rect = pygame.Rect(
-                slot_x,
-                slot_y,
-                self.config.items["slot_size"],
-                self.config.items["slot_size"],
+            slot_rects.append(
+                pygame.Rect(
+                    slot_x,
+                    slot_y,
+                    self.config.items.slot_size,
+                    self.config.items.slot_size,
+                )
             )
+        return slot_rects
 
-            if i == inventory.selected_index:
-                color = Color(0, 0, 255, 128)
-                width = 10
-            else:
-                color = "dark gray"
-                width = 5
+    def _build_inventory_overlay(self, slot_rects):
+        """
+        Pre-renders the unselected borders of all inventory slots.
+        :param slot_rects: The screen rectangles of the inventory slots.
+        :return: tuple
+        """
+        overlay_rect = slot_rects[0].unionall(slot_rects)
+        overlay = pygame.Surface(overlay_rect.size, pygame.SRCALPHA).convert_alpha()
+        overlay.fill((0, 0, 0, 0))
+        for slot_rect in slot_rects:
+            pygame.draw.rect(
+                overlay,
+                self._UNSELECTED_SLOT_COLOR,
+                slot_rect.move(-overlay_rect.x, -overlay_rect.y),
+                5,
+            )
+        return overlay, overlay_rect.topleft
+
+    def draw_inventory(self, player_model):
+        """
+        Draws the player's inventory on the screen.
+        :param player_model: The player model.
+        :return: None
+        """
+        inventory = player_model.inventory
+        screen = self.screen
+        slots = inventory.slots
+        slot_rects = self._slot_rects
 
-            pygame.draw.rect(self.screen, color, slot_rect, width)
+        screen.blit(self._inventory_overlay, self._inventory_overlay_position)
+        pygame.draw.rect(
+            screen, self._SELECTED_SLOT_COLOR, slot_rects[inventory.selected_index], 10
+        )
+
+        blit_sequence = []
+        for i, slot_rect in enumerate(slot_rects):
+            inventory_item = slots[i]
+            if inventory_item is not None:
+                item_texture = inventory_item.texture_surface
+                if item_texture is None:
+                    item_texture = inventory_item.texture_surface = self.get_texture(
+                        inventory_item.texture
+                    )
 
-            if inventory.slots[i] is not None:
-                inventory_item = inventory.slots[i].texture
-                item_texture = self.textures[inventory_item]
+                blit_sequence.append((item_texture, slot_rect.topleft))
 
-                self.screen.blit(item_texture, (slot_rect.x, slot_rect.y))
+        screen.blits(blit_sequence, doreturn=False)
 
     def draw_world(self, player_model, item_manager, enemy_manager):
         """
@@ -343,18 +528,24 @@ class View:
         :param enemy_manager: The enemy manager.
         :return: None
         """
+        screen = self.screen
         camera_rect = self.get_camera_rect(player_model.rect)
+        current_time = pygame.time.get_ticks()
+        mouse_position = pygame.mouse.get_pos()
 
-        self.screen.fill("black")
-        self.screen.blit(self.map_surface, (0, 0), camera_rect)
+        if not self._map_covers_screen:
+            screen.fill(self._BACKGROUND_COLOR)
+        screen.blit(self.map_surface, (0, 0), camera_rect)
 
         self._draw_ground_items(item_manager, camera_rect)
         self._draw_vehicles(camera_rect)
         player_screen_rect = self._draw_player(player_model, camera_rect)
-        self._draw_enemies(enemy_manager, camera_rect)
+        self._draw_enemies(enemy_manager, camera_rect, current_time)
         self._draw_projectiles(camera_rect)
 
-        self._draw_held_item(player_model, player_screen_rect)
+        self._draw_held_item(
+            player_model, player_screen_rect, current_time, mouse_position
+        )
         self.draw_inventory(player_model)
         self.draw_ui(player_model)
 
@@ -370,9 +561,23 @@ class View:
         :param color: The color of the text.
         :return: None
         """
-        font = pygame.font.Font(self.config.display["font"], size)
-        text = font.render(text, True, color)
-        self.screen.blit(text, (position_x - text.get_width() // 2, position_y))
+        text_key = (text, size, color)
+        text_surface = self._text_cache.get(text_key)
+        if text_surface is None:
+            font = self._fonts.get(size)
+            if font is None:
+                font = pygame.font.Font(self.config.display.font, size)
+                self._fonts[size] = font
+
+            if len(self._text_cache) >= self._TEXT_CACHE_LIMIT:
+                del self._text_cache[next(iter(self._text_cache))]
+
+            text_surface = font.render(text, True, color)
+            self._text_cache[text_key] = text_surface
+
+        self.screen.blit(
+            text_surface, (position_x - text_surface.get_width() // 2, position_y)
+        )
 
     def draw_menu(self, buttons, highlited_index):
         """
@@ -381,25 +586,45 @@ class View:
         :param highlited_index: The index of the highlighted button.
         :return: None
         """
-        self.screen.fill("black")
+        menu_key = (
+            self.config.state,
+            self.config.current_score,
+            self.config.highscore,
+            highlited_index,
+        )
+        if menu_key == self._menu_key:
+            self.screen.blit(self._menu_surface, (0, 0))
+            pygame.display.flip()
+            return
+
+        self.screen.fill(self._BACKGROUND_COLOR)
 
-        center_x = self.config.display["screen_size"][0] // 2
-        title = "SCHMOPP" if self.config.state == "START" else "WASTED"
-        color = "white" if title == "SCHMOPP" else "red"
+        center_x = self.config.display.screen_size[0] // 2
+        if self.config.state == "START":
+            title, color = "SCHMOPP", self._MENU_TEXT_COLOR
+        else:
+            title, color = "WASTED", self._GAME_OVER_COLOR
         self.draw_text(title, 72, center_x, 100, color)
         if self.config.state == "GAME OVER":
             score_text = f"Final Score: {self.config.current_score}"
             best_score_text = f"Best Score: {self.config.highscore}"
-            self.draw_text(score_text, 32, center_x, 180, "white")
-            self.draw_text(best_score_text, 24, center_x, 220, "yellow")
+            self.draw_text(score_text, 32, center_x, 180, self._MENU_TEXT_COLOR)
+            self.draw_text(
+                best_score_text, 24, center_x, 220, self._HIGHSCORE_COLOR
+            )
 
         for i, button in enumerate(buttons):
-            color = "white" if i == highlited_index else "gray25"
+            if i == highlited_index:
+                color = self._MENU_TEXT_COLOR
+            else:
+                color = self._INACTIVE_BUTTON_COLOR
             pygame.draw.rect(self.screen, color, button["rect"], 3)
             self.draw_text(
                 button["text"], 36, button["rect"].centerx, button["rect"].y + 50, color
             )
 
+        self._menu_surface = self.screen.copy()
+        self._menu_key = menu_key
         pygame.display.flip()
 
     def draw_ui(self, player):
@@ -409,7 +634,7 @@ class View:
         :return: None
         """
         health_text = f"Health: {player.hp}"
-        self.draw_text(health_text, 36, 1050, 30, "blue")
+        self.draw_text(health_text, 36, 1050, 30, self._UI_TEXT_COLOR)
 
         score_text = f"Score: {self.config.current_score}"
-        self.draw_text(score_text, 36, 1050, 80, "blue")
+        self.draw_text(score_text, 36, 1050, 80, self._UI_TEXT_COLOR)